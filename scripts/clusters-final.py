@@ -1,4 +1,3 @@
-import os
 from time import *
 
 from matplotlib import pyplot as plt
@@ -9,31 +8,10 @@ from cdlib import algorithms
 from cdlib.classes import *
 from cdlib import viz
 
-def read_pajek(file, path = '../nets'):
-  """
-  Read undirected multigraph with node clusters from Pajek file.
-  """
-  
-  G = nx.MultiGraph(name = file)
-  
-  with open(os.path.join(path, file + '.net'), 'r') as file:
-    nodes = {}
-    for line in file:
-      if line.startswith('*vertices'):
-        continue
-      elif line.startswith('*'):
-        break
-      else:
-        node = line.strip().split('"')
-        nodes[node[0].strip()] = node[1]
-        G.add_node(node[1], cluster = int(node[2]) if len(node[2]) > 0 else 0)
-        
-    for line in file:
-      edge = line.strip().split(' ')
-      G.add_edge(nodes[edge[0]], nodes[edge[1]])
-      
-  return G
-  
+from netpy import communities, core
+from netpy.cache import cached
+from netpy.graphs import graph_info
+
 def known_clusters(G):
   """
   Clustering of undirected multigraph G from node attribute 'cluster'.
@@ -50,33 +28,17 @@ def known_clusters(G):
     
   return NodeClustering(list(clusters.values()), G, 'known')
   
-def graph_info(G):
+def leiden(G):
   """
-  Print basic statistics of undirected multigraph G.
+  Leiden clustering of undirected multigraph G shared with other scripts through cache.
   """
-  
-  print("{:>15s} | '{:s}'".format('Graph', G.name))
-  
-  multi = False
-  for edge in G.edges():
-    if G.number_of_edges(edge[0], edge[1]) > 1:
-      multi = True
-      break
-      
-  print("{:>15s} | '{:s}'".format('Type', '===' if multi else '---'))
-  
-  n = len(G)
-  m = G.number_of_edges()
-  ks = [k for _, k in G.degree()]
-  
-  print("{:>15s} | {:,d} ({:,d})".format('Nodes', n, nx.number_of_isolates(G)))
-  print("{:>15s} | {:,d} ({:,d})".format('Edges', m, nx.number_of_selfloops(G)))
-  print("{:>15s} | {:.1f} ({:,d}, {:,d})".format('Degree', 2 * m / n, min(ks), max(ks)))
-  
-  CCs = sorted(nx.connected_components(G), key = len, reverse = True)
 
-  print("{:>15s} | {:.1f}% ({:,d})\n".format('Components', 100 * len(CCs[0]) / n, len(CCs)))
-  
+  clusters = {}
+  for i, c in cached(core.from_networkx(G), 'leiden', communities.leiden).items():
+    clusters.setdefault(c, []).append(i)
+
+  return NodeClustering(list(clusters.values()), G, 'Leiden')
+
 def clusters_info(G, alg, label, k = 100):
   """
   Print basic statistics of clustering of undirected multigraph G.
@@ -136,11 +98,12 @@ for file in ['karate', 'dolphins', 'women']:
 
   # Constructs graph representing real network
 
-  G = read_pajek(file)
+  H = core.read_pajek(file)
+  G = H.to_networkx(cluster = 'cluster', multi = True)
 
   # Prints basic statistics of real network
 
-  graph_info(G)
+  graph_info(H)
 
   # Prints basic statistics of community structure of real network
 
@@ -168,16 +131,17 @@ for file in ['got-appearance', 'diseasome', 'wars', 'ingredients']:
 
   # Constructs graph representing real network
 
-  G = read_pajek(file)
+  H = core.read_pajek(file)
+  G = H.to_networkx(cluster = 'cluster', multi = True)
 
   # Prints basic statistics of real network
 
-  graph_info(G)
+  graph_info(H)
 
   # Finds community structure of real network
 
   comms = clusters_info(G, algorithms.label_propagation, 'LPA') # fast algorithm
-  comms = clusters_info(G, algorithms.leiden, 'Leiden') # modularity optimization
+  comms = clusters_info(G, leiden, 'Leiden', 1) # modularity optimization
   comms = clusters_info(G, algorithms.infomap, 'Infomap') # network dynamics
   # comms = clusters_info(G, algorithms.sbm_dl, 'SBM', 10) # arbitrary clusters
 
@@ -266,11 +230,12 @@ for file in ['got-appearance', 'diseasome', 'wars', 'ingredients']:
 
   # Constructs graph representing real network
 
-  G = read_pajek(file)
+  H = core.read_pajek(file)
+  G = H.to_networkx(cluster = 'cluster', multi = True)
 
   # Prints basic statistics of real network
 
-  graph_info(G)
+  graph_info(H)
 
   # Finds main k-core of real network
 
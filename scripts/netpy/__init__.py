@@ -0,0 +1,16 @@
+"""
+Shared network analysis utilities for NetPy '24 scripts.
+
+Submodules are imported on first access, so that importing the package
+does not pull in plotting, community detection or embedding libraries.
+"""
+
+import importlib
+
+__all__ = ['batch', 'cache', 'centrality', 'classify', 'communities', 'core', 'degrees', 'embeddings', 'graphs', 'links', 'parallel', 'robustness', 'ties']
+
+def __getattr__(name):
+  if name in __all__:
+    return importlib.import_module('.' + name, __name__)
+
+  raise AttributeError("module '{:s}' has no attribute '{:s}'".format(__name__, name))
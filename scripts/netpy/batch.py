@@ -0,0 +1,272 @@
+import io
+import os
+import sys
+import json
+import signal
+import argparse
+import traceback
+import contextlib
+from time import time
+from multiprocessing.connection import wait
+
+import numpy as np
+
+from . import centrality, classify, communities, core, degrees, graphs, links, parallel, ties
+from .cache import cached
+
+def _info(G, output):
+  """
+  Print basic statistics of core graph G.
+  """
+
+  graphs.graph_info(G, True)
+
+def _centrality(G, output):
+  """
+  Print highest centrality nodes of core graph G.
+  """
+
+  centrality.top_nodes(G, centrality.degree_centrality(G), 'degree')
+  centrality.top_nodes(G, centrality.pagerank(G), 'pagerank')
+
+  if G.directed:
+    h, a = centrality.hits(G, max_iter = 1000)
+    centrality.top_nodes(G, h, 'hubs')
+    centrality.top_nodes(G, a, 'authorities')
+
+  centrality.top_nodes(G, cached(G, 'closeness', centrality.closeness), 'closeness')
+  centrality.top_nodes(G, cached(G, 'betweenness', centrality.betweenness), 'betweenness')
+
+def _clusters(G, output):
+  """
+  Print statistics of Leiden community structure of core graph G.
+  """
+
+  import networkx as nx
+
+  clusters = cached(G, 'leiden', communities.leiden)
+
+  comms = {}
+  for i, c in clusters.items():
+    comms.setdefault(c, []).append(i)
+
+  c = len(comms)
+  C = max(len(comm) for comm in comms.values())
+
+  print("{:>15s} | '{:s}'".format('Graph', G.name))
+  print("{:>15s} | '{:s}'".format('Algorithm', 'Leiden'))
+  print("{:>15s} | {:,d} x {:,.0f} ({:.1f}%)".format('Clusters', c, len(G) / c, 100 * C / len(G)))
+  print("{:>15s} | {:.3f}\n".format('Q', nx.community.modularity(G.to_networkx(), comms.values())))
+
+def _cores(G, output):
+  """
+  Print main k-core of core graph G.
+  """
+
+  cores = G.core_number()
+  k = cores.max()
+
+  print("{:>15s} | '{:s}'".format('Graph', G.name))
+  print("{:>15s} | {:,d}\n".format(str(k) + '-core', np.count_nonzero(cores == k)))
+
+  centrality.top_nodes(G, cores, 'core')
+
+def _features(G, output):
+  """
+  Write node features of core graph G to tab-separated file.
+  """
+
+  DC = centrality.degree_centrality(G)
+  PR = centrality.pagerank(G)
+  C = G.clustering()
+  CC = cached(G, 'closeness', centrality.closeness)
+  BC = cached(G, 'betweenness', centrality.betweenness)
+  K = G.core_number()
+
+  file = os.path.join(output, G.name + '-features.tab')
+  with open(file, 'w') as f:
+    f.write("m#node\tC#degree\tC#pagerank\tC#clustering\tC#closeness\tC#betweenness\tC#core\tcD#class\n")
+    for row in zip(G.labels, DC, PR, C, CC, BC, K, G.clusters):
+      f.write("{:s}\t{:f}\t{:f}\t{:f}\t{:f}\t{:f}\t{:d}\t{:d}\n".format(*row))
+
+  print("{:>15s} | '{:s}'\n".format('Features', file))
+
+def _degrees(G, output):
+  """
+  Print fitted tails of degree distribution of core graph G.
+  """
+
+  degrees.fit_info(G.name, G.degree(weighted = True), workers = 1)
+
+ANALYSES = {
+  'info': _info,
+  'centrality': _centrality,
+  'clusters': _clusters,
+  'cores': _cores,
+  'features': _features,
+  'degrees': _degrees,
+  'links': lambda G, output: links.links_info(G),
+  'classify': lambda G, output: classify.classify_info(G),
+  'ties': lambda G, output: ties.ties_info(G, workers = 1)
+}
+
+def _work(name, path, analyses, output, conn):
+  """
+  Run analyses of network single-process in child process group and send status with captured output.
+  """
+
+  os.setpgid(0, 0)
+
+  failed = False
+
+  buffer = io.StringIO()
+  with contextlib.redirect_stdout(buffer):
+    try:
+      G = core.read_pajek(name, path)
+    except Exception:
+      print(traceback.format_exc())
+      analyses, failed = [], True
+
+    for analysis in analyses:
+      try:
+        ANALYSES[analysis](G, output)
+      except Exception:
+        print("{:>15s} | '{:s}'".format('Failed', analysis))
+        print(traceback.format_exc())
+        failed = True
+
+  conn.send(('failed' if failed else 'done', buffer.getvalue()))
+  conn.close()
+
+def _kill(process):
+  """
+  Kill child process with any processes it started in its process group.
+  """
+
+  try:
+    os.killpg(process.pid, signal.SIGKILL)
+  except OSError:
+    process.kill()
+
+def _size(name, path):
+  """
+  Size of Pajek file of network in bytes.
+  """
+
+  try:
+    return os.path.getsize(os.path.join(path, name + '.net'))
+  except OSError:
+    return 0
+
+def _completed(resume, analyses):
+  """
+  Networks completed with same analyses according to progress file.
+  """
+
+  done = set()
+  if resume is not None and os.path.exists(resume):
+    with open(resume, 'r') as file:
+      for line in file:
+        try:
+          entry = json.loads(line)
+        except ValueError:
+          continue
+        if entry['status'] == 'done' and entry['analyses'] == analyses:
+          done.add(entry['network'])
+
+  return done
+
+def run(networks, analyses = ['info'], path = '../nets', workers = None, timeout = None, resume = None, output = '.'):
+  """
+  Run analyses of networks in parallel processes starting with largest and print output as each network finishes.
+  """
+
+  analyses = list(analyses)
+  for analysis in analyses:
+    if analysis not in ANALYSES:
+      raise ValueError("Unknown analysis '{:s}'".format(analysis))
+
+  done = _completed(resume, analyses)
+  queue = sorted((name for name in dict.fromkeys(networks) if name not in done), key = lambda name: -_size(name, path))
+
+  ctx = parallel.context()
+  running = {}
+  status = {name: 'done' for name in networks if name in done}
+
+  try:
+    while queue or running:
+      while queue and len(running) < parallel.workers(workers):
+        name = queue.pop(0)
+
+        recv, send = ctx.Pipe(duplex = False)
+        process = ctx.Process(target = _work, args = (name, path, analyses, output, send))
+        process.start()
+        send.close()
+
+        try:
+          os.setpgid(process.pid, process.pid)
+        except OSError:
+          pass
+
+        running[name] = (process, recv, time())
+
+      deadline = None if timeout is None else min(tic for _, _, tic in running.values()) + timeout
+      ready = wait([obj for process, recv, _ in running.values() for obj in (recv, process.sentinel)], None if deadline is None else max(deadline - time(), 0))
+
+      for name, (process, recv, tic) in list(running.items()):
+        if recv in ready or process.sentinel in ready:
+          try:
+            result, text = recv.recv()
+          except EOFError:
+            result, text = 'crashed', ''
+          process.join()
+        elif timeout is not None and time() - tic >= timeout:
+          _kill(process)
+          process.join()
+          result, text = 'timeout', ''
+        else:
+          continue
+
+        del running[name]
+        recv.close()
+        status[name] = result
+
+        print("{:>15s} | '{:s}'".format('Network', name))
+        print(text, end = '')
+        print("{:>15s} | {:s} ({:.1f} sec)\n".format('Status', result, time() - tic))
+        sys.stdout.flush()
+
+        if resume is not None:
+          with open(resume, 'a') as file:
+            file.write(json.dumps({'network': name, 'analyses': analyses, 'status': result}) + '\n')
+  finally:
+    for process, recv, _ in running.values():
+      _kill(process)
+      process.join()
+      recv.close()
+
+  return status
+
+def main(argv = None):
+  """
+  Command-line entry point of parallel multi-network batch runner.
+  """
+
+  parser = argparse.ArgumentParser(prog = 'python -m netpy', description = 'Run analyses of Pajek networks in parallel processes.')
+  parser.add_argument('networks', nargs = '+', help = "network names in path or 'all'")
+  parser.add_argument('-a', '--analyses', nargs = '+', default = ['info'], choices = list(ANALYSES), help = 'analyses to run (default: info)')
+  parser.add_argument('-p', '--path', default = '../nets', help = 'directory of Pajek files (default: ../nets)')
+  parser.add_argument('-w', '--workers', type = int, help = 'number of parallel processes (default: all cores)')
+  parser.add_argument('-t', '--timeout', type = float, help = 'timeout per network in seconds')
+  parser.add_argument('-r', '--resume', metavar = 'FILE', help = 'progress file to skip completed networks and record new ones')
+  parser.add_argument('-o', '--output', default = '.', help = 'directory of written files (default: .)')
+
+  args = parser.parse_args(argv)
+
+  networks = args.networks
+  if networks == ['all']:
+    networks = sorted(file[:-4] for file in os.listdir(args.path) if file.endswith('.net'))
+
+  status = run(networks, args.analyses, args.path, args.workers, args.timeout, args.resume, args.output)
+
+  return 0 if all(result == 'done' for result in status.values()) else 1
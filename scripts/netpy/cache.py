@@ -0,0 +1,274 @@
+import os
+import json
+import inspect
+import hashlib
+import zipfile
+import weakref
+import tempfile
+from collections import OrderedDict
+
+import numpy as np
+
+from . import core
+
+def graph_hash(G):
+  """
+  Content hash of nodes, edges and multiplicities of core graph or (multi)graph G, memoized per graph object and size.
+  """
+
+  if isinstance(G, core.Graph):
+    if not hasattr(G, '_hash'):
+      G._hash = _digest(G)
+    return G._hash
+
+  size = len(G), G.number_of_edges()
+  if _hashes.get(G, (None, None))[0] != size:
+    _hashes[G] = size, _nx_hash(G)
+
+  return _hashes[G][1]
+
+_hashes = weakref.WeakKeyDictionary()
+
+def _nx_hash(G):
+  """
+  Content hash of (multi)graph G matching hash of equivalent core graph.
+  """
+
+  H = core.from_networkx(G)
+
+  weights = np.fromiter((1.0 if w is None else w for _, _, w in G.edges(data = 'weight')), dtype = float, count = G.number_of_edges())
+  if np.all(weights == 1):
+    return _digest(H)
+
+  index = H.index
+  ends = np.sort(np.fromiter((index[i] for edge in G.edges() for i in edge), dtype = np.int64, count = 2 * len(weights)).reshape(-1, 2), axis = 1)
+
+  h = hashlib.sha1(_digest(H).encode())
+  h.update(weights[np.lexsort((weights, ends[:, 1], ends[:, 0]))].tobytes())
+
+  return h.hexdigest()
+
+def _digest(G):
+  """
+  Hash of labels and CSR arrays of core graph G.
+  """
+
+  h = hashlib.sha1()
+  h.update('\n'.join(map(str, G.labels)).encode())
+  if G.directed:
+    h.update(b'directed')
+  for x in [G.indptr, G.indices, G.weights]:
+    h.update(np.ascontiguousarray(x).tobytes())
+
+  return h.hexdigest()
+
+def _pack(G, result):
+  """
+  Convert result keyed by nodes of G to array aligned with node order.
+  """
+
+  if isinstance(result, dict):
+    labels = G.labels if isinstance(G, core.Graph) else list(G)
+    return 'dict', np.array([result[i] for i in labels])
+  elif isinstance(result, np.ndarray):
+    return 'array', np.array(result)
+  elif np.isscalar(result):
+    return 'scalar', np.array(result)
+
+  raise TypeError("Cannot cache result of type '{:s}'".format(type(result).__name__))
+
+def _unpack(G, kind, values):
+  """
+  Convert array aligned with node order of G back to result.
+  """
+
+  if kind == 'dict':
+    labels = G.labels if isinstance(G, core.Graph) else list(G)
+    if len(values) != len(labels):
+      raise ValueError("Cached result of {:,d} nodes for graph of {:,d} nodes".format(len(values), len(labels)))
+    return dict(zip(labels, values.tolist()))
+  elif kind == 'scalar':
+    return values.item()
+
+  return values.copy()
+
+def _json(x):
+  """
+  Canonical JSON text of parameter values.
+  """
+
+  return json.dumps(x, sort_keys = True, default = repr)
+
+def _defaults(func):
+  """
+  Default values of keyword parameters of func.
+  """
+
+  try:
+    return {p.name: p.default for p in inspect.signature(func).parameters.values() if p.default is not inspect.Parameter.empty}
+  except (TypeError, ValueError):
+    return {}
+
+class Cache:
+  """
+  Two-tier cache of graph computations keyed by graph content, algorithm name and parameters.
+  """
+
+  def __init__(self, path = None, memory = 2 ** 28, disk = 2 ** 30):
+    """
+    Cache with in-memory LRU tier and on-disk tier bounded by total bytes.
+    """
+
+    self.path = path or os.environ.get('NETPY_CACHE', os.path.join(os.path.expanduser('~'), '.cache', 'netpy'))
+    self.memory = memory
+    self.disk = disk
+
+    self.lru = OrderedDict()
+    self.size = 0
+
+  def key(self, G, name, func, **params):
+    """
+    Cache key of algorithm name implemented by func with non-default parameters on graph G.
+    """
+
+    defaults = _defaults(func)
+    params = {p: x for p, x in params.items() if p not in defaults or _json(x) != _json(defaults[p])}
+
+    impl = getattr(func, '__module__', None) or '', getattr(func, '__qualname__', None) or repr(func)
+
+    return hashlib.sha1('\n'.join([graph_hash(G), name, '.'.join(impl), _json(params)]).encode()).hexdigest()
+
+  def get(self, key):
+    """
+    Kind and values of cached result or None.
+    """
+
+    if key in self.lru:
+      self.lru.move_to_end(key)
+      return self.lru[key]
+
+    file = os.path.join(self.path, key + '.npz')
+    try:
+      with np.load(file, allow_pickle = False) as data:
+        item = str(data['kind']), data['values']
+    except (OSError, KeyError, ValueError, zipfile.BadZipFile):
+      return None
+
+    try:
+      os.utime(file)
+    except OSError:
+      pass
+
+    self._remember(key, item)
+
+    return item
+
+  def put(self, key, item):
+    """
+    Store kind and values of result in both tiers.
+    """
+
+    self._remember(key, item)
+
+    if self.disk > 0:
+      file = os.path.join(self.path, key + '.npz')
+      tmp = None
+      try:
+        os.makedirs(self.path, exist_ok = True)
+        with tempfile.NamedTemporaryFile(dir = self.path, suffix = '.tmp', delete = False) as f:
+          tmp = f.name
+          np.savez(f, kind = item[0], values = item[1])
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, file)
+      except OSError:
+        if tmp is not None and os.path.exists(tmp):
+          os.remove(tmp)
+        return
+
+      self._evict()
+
+  def clear(self):
+    """
+    Remove all cached results from both tiers.
+    """
+
+    self.lru.clear()
+    self.size = 0
+
+    if os.path.isdir(self.path):
+      for entry in os.scandir(self.path):
+        if entry.name.endswith('.npz'):
+          os.remove(entry.path)
+
+  def __call__(self, G, name, func, **params):
+    """
+    Result of func(G, **params) computed once per graph content, name and parameters.
+    """
+
+    key = self.key(G, name, func, **params)
+
+    item = self.get(key)
+    if item is not None:
+      try:
+        return _unpack(G, *item)
+      except ValueError:
+        pass
+
+    item = _pack(G, func(G, **params))
+    self.put(key, item)
+
+    return _unpack(G, *item)
+
+  def _remember(self, key, item):
+    """
+    Insert item into in-memory tier evicting least recently used items.
+    """
+
+    if key in self.lru:
+      self.size -= self.lru.pop(key)[1].nbytes
+
+    if item[1].nbytes > self.memory:
+      return
+
+    self.lru[key] = item
+    self.size += item[1].nbytes
+
+    while self.size > self.memory:
+      _, (_, values) = self.lru.popitem(last = False)
+      self.size -= values.nbytes
+
+  def _evict(self):
+    """
+    Remove least recently used files while on-disk tier exceeds its bound, skipping files removed by other processes.
+    """
+
+    files = []
+    try:
+      for entry in os.scandir(self.path):
+        if entry.name.endswith('.npz'):
+          try:
+            stat = entry.stat()
+          except OSError:
+            continue
+          files.append((stat.st_mtime, stat.st_size, entry.path))
+    except OSError:
+      return
+
+    total = sum(size for _, size, _ in files)
+    for _, size, file in sorted(files):
+      if total <= self.disk:
+        break
+      try:
+        os.remove(file)
+      except OSError:
+        pass
+      total -= size
+
+default = Cache()
+
+def cached(G, name, func, **params):
+  """
+  Result of func(G, **params) from default cache.
+  """
+
+  return default(G, name, func, **params)
@@ -0,0 +1,109 @@
+import numpy as np
+
+from . import core
+
+def degree_centrality(G):
+  """
+  Degree centrality of nodes of core (di)graph G.
+  """
+
+  return G.degree() / max(len(G) - 1, 1)
+
+def in_degree_centrality(G):
+  """
+  In-degree centrality of nodes of core (di)graph G.
+  """
+
+  return G.in_degree() / max(len(G) - 1, 1)
+
+def out_degree_centrality(G):
+  """
+  Out-degree centrality of nodes of core (di)graph G.
+  """
+
+  return G.out_degree() / max(len(G) - 1, 1)
+
+def pagerank(G, alpha = 0.85, personalization = None, weighted = False, tol = 1e-06, max_iter = 100):
+  """
+  PageRank of nodes of core (di)graph G by power iteration with sparse products, batched over columns of personalization.
+  """
+
+  n = len(G)
+
+  AT = G.adjacency(weighted, transpose = True).astype(float)
+  out = G.out_degree(weighted).astype(float)
+  dangling = out == 0
+  inv = np.divide(1, out, out = np.zeros(n), where = ~dangling)
+
+  P = np.full(n, 1 / n) if personalization is None else np.asarray(personalization, dtype = float)
+  batch = P.ndim > 1
+  P = P.reshape(n, -1) / P.reshape(n, -1).sum(0)
+
+  x = P.copy()
+  for _ in range(max_iter):
+    last = x
+    x = alpha * (AT @ (inv[:, None] * x) + P * x[dangling].sum(0)) + (1 - alpha) * P
+    if np.all(np.abs(x - last).sum(0) < n * tol):
+      return x if batch else x[:, 0]
+
+  raise RuntimeError("PageRank failed to converge in {:d} iterations".format(max_iter))
+
+def hits(G, weighted = False, tol = 1e-08, max_iter = 100):
+  """
+  Hub and authority scores of nodes of core (di)graph G by power iteration with sparse products.
+  """
+
+  n = len(G)
+
+  A = G.adjacency(weighted).astype(float)
+  AT = G.adjacency(weighted, transpose = True).astype(float)
+
+  h = np.full(n, 1 / n)
+  for _ in range(max_iter):
+    last = h
+    h = A @ (AT @ h)
+    if h.max() > 0:
+      h /= h.max()
+    if np.abs(h - last).sum() < tol:
+      a = AT @ h
+      return h / max(h.sum(), 1e-300), a / max(a.sum(), 1e-300)
+
+  raise RuntimeError("HITS failed to converge in {:d} iterations".format(max_iter))
+
+def closeness(G):
+  """
+  Closeness centrality of nodes of core (di)graph G by NetworkX.
+  """
+
+  import networkx as nx
+
+  return np.array(list(nx.closeness_centrality(G.to_networkx()).values()))
+
+def betweenness(G, k = None, seed = None):
+  """
+  Betweenness centrality of nodes of core (di)graph G by NetworkX, estimated from k pivots if given.
+  """
+
+  import networkx as nx
+
+  return np.array(list(nx.betweenness_centrality(G.to_networkx(), k = k, seed = seed).values()))
+
+def top_nodes(G, centrality, label, n = 15):
+  """
+  Print highest centrality nodes of core graph or (multi)graph G.
+  """
+
+  if not isinstance(G, core.Graph):
+    G = core.from_networkx(G)
+  if isinstance(centrality, dict):
+    centrality = [centrality[i] for i in G.labels]
+
+  print("{:>15s} | '{:s}'".format('Graph', G.name))
+  print("{:>15s} | '{:s}'".format('Centrality', label))
+
+  centrality = np.asarray(centrality)
+  ks = G.degree(weighted = True)
+
+  for i in np.lexsort((np.array(G.labels, dtype = str), -ks, -centrality))[:n]:
+    print("{:>15.8f} | '{:s}' ({:,d})".format(centrality[i], str(G.labels[i]), ks[i]))
+  print()
@@ -0,0 +1,160 @@
+from time import time
+
+import numpy as np
+from scipy import sparse
+
+def labels(G):
+  """
+  Class indices of nodes of core graph G from node clusters with class values.
+  """
+
+  values, y = np.unique(G.clusters, return_inverse = True)
+
+  return y, values
+
+def split(n, fraction = 0.5, seed = None):
+  """
+  Random mask of fraction of n nodes with known labels.
+  """
+
+  return np.random.default_rng(seed).random(n) < fraction
+
+def _propagation(G, weighted = True):
+  """
+  Row-normalized adjacency matrix of core graph G with multiplicities as weights or ignored.
+  """
+
+  A = G.adjacency(weighted, loops = False).astype(float)
+  if G.directed:
+    A = (A + A.T).tocsr()
+
+  k = np.asarray(A.sum(1)).ravel()
+
+  return sparse.diags(np.divide(1, k, out = np.zeros(len(k)), where = k > 0)) @ A, k > 0
+
+def wvrn(G, y, train, weighted = True, beta = 1.0, decay = 0.99, tol = 1e-04, max_iter = 100):
+  """
+  Weighted-vote relational neighbour classifier with relaxation labeling on core graph G with number and time of iterations.
+  """
+
+  n, c = len(G), y.max() + 1
+  P, linked = _propagation(G, weighted)
+
+  prior = np.bincount(y[train], minlength = c) / max(train.sum(), 1)
+
+  Y = np.tile(prior, (n, 1))
+  Y[train] = np.eye(c)[y[train]]
+
+  test = ~train & linked
+  P = P[test]
+
+  tic, t = time(), -1
+  for t in range(max_iter):
+    Z = P @ Y
+    change = np.abs(Z - Y[test]).max() if test.any() else 0
+
+    Y[test] = beta * Z + (1 - beta) * Y[test]
+    beta *= decay
+
+    if change < tol:
+      break
+
+  return Y, t + 1, time() - tic
+
+def _relational(P, L):
+  """
+  Class distribution of labelled neighbours of nodes.
+  """
+
+  return np.asarray(P @ L)
+
+def _fit(X, y, c, l2 = 1.0):
+  """
+  Multinomial logistic regression weights with bias fitted by L-BFGS.
+  """
+
+  from scipy import optimize, special
+
+  Xb = np.hstack([X, np.ones((len(X), 1))])
+  Y = np.eye(c)[y]
+  mask = np.ones((Xb.shape[1], c))
+  mask[-1] = 0
+
+  def loss(w):
+    W = w.reshape(Xb.shape[1], c)
+    Z = Xb @ W
+    logP = Z - special.logsumexp(Z, axis = 1, keepdims = True)
+
+    return -np.sum(Y * logP) + l2 / 2 * np.sum(mask * W ** 2), (Xb.T @ (np.exp(logP) - Y) + l2 * mask * W).ravel()
+
+  w = optimize.minimize(loss, np.zeros(Xb.shape[1] * c), jac = True, method = 'L-BFGS-B').x
+
+  return w.reshape(Xb.shape[1], c)
+
+def _predict(W, X):
+  """
+  Class probabilities of multinomial logistic regression.
+  """
+
+  from scipy import special
+
+  return special.softmax(np.hstack([X, np.ones((len(X), 1))]) @ W, axis = 1)
+
+def ica(G, y, train, X = None, weighted = True, max_iter = 10):
+  """
+  Iterative classification on core graph G with local classifier on node and relational features, with number and time of iterations excluding fitting.
+  """
+
+  n, c = len(G), y.max() + 1
+  P, _ = _propagation(G, weighted)
+  X = np.zeros((n, 0)) if X is None else np.asarray(X, dtype = float)
+
+  L = np.zeros((n, c))
+  L[train] = np.eye(c)[y[train]]
+
+  F = np.hstack([X, _relational(P, L)])
+  W = _fit(F[train], y[train], c)
+
+  Y = L.copy()
+  Y[~train] = _predict(W, F[~train])
+
+  pred = Y.argmax(1)
+
+  tic, t = time(), -1
+  for t in range(max_iter):
+    L[~train] = np.eye(c)[pred[~train]]
+    F = np.hstack([X, _relational(P, L)])
+    Y[~train] = _predict(W, F[~train])
+
+    last, pred = pred, Y.argmax(1)
+    if np.array_equal(last, pred):
+      break
+
+  return Y, t + 1, time() - tic
+
+def accuracy(Y, y, mask):
+  """
+  Classification accuracy of label probabilities Y on masked nodes.
+  """
+
+  return np.mean(Y[mask].argmax(1) == y[mask])
+
+def classify_info(G, fraction = 0.5, seed = None):
+  """
+  Print accuracy of collective node classification on core graph G.
+  """
+
+  y, values = labels(G)
+  train = split(len(G), fraction, seed)
+
+  print("{:>15s} | '{:s}'".format('Graph', G.name))
+  print("{:>15s} | {:,d} ({:.0f}%)".format('Classes', len(values), 100 * fraction))
+
+  prior = np.bincount(y[train], minlength = len(values)).argmax()
+  print("{:>15s} | {:.3f}".format('Majority', np.mean(y[~train] == prior)))
+
+  for label, alg in [('wvRN', wvrn), ('ICA', ica)]:
+    Y, k, t = alg(G, y, train)
+
+    print("{:>15s} | {:.3f} ({:d}x, {:.1f} ms)".format(label, accuracy(Y, y, ~train), k, 1000 * t / max(k, 1)))
+  print()
@@ -0,0 +1,38 @@
+from . import core
+
+def clusters(comms):
+  """
+  Map nodes to indices of their communities in CDlib clustering.
+  """
+
+  clusters = {}
+  for c, comm in enumerate(comms.communities):
+    for i in comm:
+      clusters[i] = c
+
+  return clusters
+
+def _graph(G):
+  """
+  NetworkX graph of core graph G or G itself.
+  """
+
+  return G.to_networkx() if isinstance(G, core.Graph) else G
+
+def leiden(G):
+  """
+  Map nodes of core graph or NetworkX graph G to indices of their Leiden communities.
+  """
+
+  from cdlib import algorithms
+
+  return clusters(algorithms.leiden(_graph(G)))
+
+def infomap(G):
+  """
+  Map nodes of core graph or NetworkX graph G to indices of their Infomap communities.
+  """
+
+  from cdlib import algorithms
+
+  return clusters(algorithms.infomap(_graph(G)))
@@ -0,0 +1,325 @@
+import os
+
+import numpy as np
+from scipy import sparse
+
+class Graph:
+  """
+  Weighted simple (di)graph in CSR arrays with parallel edges collapsed into integer multiplicities.
+  """
+
+  def __init__(self, labels, src, dst, name = '', clusters = None, directed = False):
+    """
+    Construct graph on labelled nodes from edge or arc endpoints with one sort and unique pass.
+    """
+
+    self.name = name
+    self.directed = directed
+    self.labels = list(labels)
+    self.index = {label: i for i, label in enumerate(self.labels)}
+    self.clusters = np.zeros(len(self.labels), dtype = np.int64) if clusters is None else np.asarray(clusters, dtype = np.int64)
+
+    n = len(self.labels)
+    src = np.asarray(src, dtype = np.int64)
+    dst = np.asarray(dst, dtype = np.int64)
+
+    if directed:
+      keys = src * n + dst
+    else:
+      loop = src == dst
+      keys = np.concatenate([src * n + dst, dst[~loop] * n + src[~loop]])
+    keys, counts = np.unique(keys, return_counts = True)
+
+    rows, cols = np.divmod(keys, n) if n > 0 else (keys, keys)
+
+    self.indptr = np.zeros(n + 1, dtype = np.int64)
+    np.cumsum(np.bincount(rows, minlength = n), out = self.indptr[1:])
+    self.indices = cols.astype(np.int32)
+    self.weights = counts.astype(np.int32)
+
+    self.loops = np.zeros(n, dtype = np.int32)
+    self.loops[rows[rows == cols]] = self.weights[rows == cols]
+
+    if directed:
+      order = np.argsort(cols, kind = 'stable')
+
+      self.in_indptr = np.zeros(n + 1, dtype = np.int64)
+      np.cumsum(np.bincount(cols, minlength = n), out = self.in_indptr[1:])
+      self.in_indices = rows[order].astype(np.int32)
+      self.in_weights = self.weights[order]
+    else:
+      self.in_indptr, self.in_indices, self.in_weights = self.indptr, self.indices, self.weights
+
+  def __len__(self):
+    return len(self.labels)
+
+  def number_of_edges(self, weighted = False):
+    """
+    Number of distinct edges or, if weighted, of edges with multiplicities.
+    """
+
+    if self.directed:
+      return int(self.weights.sum() if weighted else len(self.indices))
+    elif weighted:
+      return int((self.weights.sum() + self.loops.sum()) // 2)
+    return int((len(self.indices) + np.count_nonzero(self.loops)) // 2)
+
+  def number_of_selfloops(self, weighted = False):
+    """
+    Number of distinct self-loops or, if weighted, of self-loops with multiplicities.
+    """
+
+    return int(self.loops.sum() if weighted else np.count_nonzero(self.loops))
+
+  def degree(self, weighted = False):
+    """
+    Node degrees with self-loops counted twice and, if weighted, with edge multiplicities.
+    """
+
+    if self.directed:
+      return self.out_degree(weighted) + self.in_degree(weighted)
+    return _row_sums(self.indptr, self.weights if weighted else None) + (self.loops if weighted else self.loops > 0)
+
+  def out_degree(self, weighted = False):
+    """
+    Node out-degrees or, if weighted, with arc multiplicities.
+    """
+
+    return _row_sums(self.indptr, self.weights if weighted else None)
+
+  def in_degree(self, weighted = False):
+    """
+    Node in-degrees or, if weighted, with arc multiplicities.
+    """
+
+    return _row_sums(self.in_indptr, self.in_weights if weighted else None)
+
+  def neighbors(self, i):
+    """
+    Indices of (out-)neighbours of node i.
+    """
+
+    return self.indices[self.indptr[i]:self.indptr[i + 1]]
+
+  def predecessors(self, i):
+    """
+    Indices of in-neighbours of node i.
+    """
+
+    return self.in_indices[self.in_indptr[i]:self.in_indptr[i + 1]]
+
+  def edges(self):
+    """
+    Endpoints and multiplicities of distinct arcs or of distinct edges with u <= v.
+    """
+
+    u = np.repeat(np.arange(len(self), dtype = np.int32), np.diff(self.indptr))
+    if self.directed:
+      return u, self.indices, self.weights
+
+    upper = u <= self.indices
+
+    return u[upper], self.indices[upper], self.weights[upper]
+
+  def adjacency(self, weighted = False, loops = True, transpose = False):
+    """
+    Sparse (transposed) adjacency matrix sharing index arrays with the graph, with multiplicities as weights or ignored.
+    """
+
+    indptr, indices, weights = (self.in_indptr, self.in_indices, self.in_weights) if transpose else (self.indptr, self.indices, self.weights)
+
+    data = weights if weighted else np.ones(len(indices), dtype = np.int32)
+    A = sparse.csr_matrix((data, indices, indptr), shape = (len(self), len(self)))
+
+    if not loops and self.loops.any():
+      A = A.copy()
+      A.setdiag(0)
+      A.eliminate_zeros()
+
+    return A
+
+  def simple(self):
+    """
+    Simple (di)graph on same nodes with multiplicities ignored.
+    """
+
+    u, v, _ = self.edges()
+
+    return Graph(self.labels, u, v, self.name, self.clusters, self.directed)
+
+  def skeleton(self):
+    """
+    Binary symmetric adjacency matrix without self-loops.
+    """
+
+    A = self.adjacency(loops = False)
+    if self.directed:
+      A = ((A + A.T) > 0).astype(np.int32).tocsr()
+
+    return A
+
+  def core_number(self):
+    """
+    Core numbers of nodes ignoring multiplicities, self-loops and directions in linear time.
+    """
+
+    A = self.skeleton()
+    indptr, indices = A.indptr.tolist(), A.indices.tolist()
+
+    deg = np.diff(A.indptr)
+    vert = np.argsort(deg, kind = 'stable').tolist()
+    pos = np.empty(len(self), dtype = np.int64)
+    pos[vert] = np.arange(len(self))
+    pos = pos.tolist()
+    start = np.searchsorted(deg[vert], np.arange(deg.max() + 1 if len(self) > 0 else 0)).tolist()
+    deg = deg.tolist()
+
+    for i in range(len(self)):
+      v = vert[i]
+      for u in indices[indptr[v]:indptr[v + 1]]:
+        if deg[u] > deg[v]:
+          du, pu = deg[u], pos[u]
+          pw = start[du]
+          w = vert[pw]
+          if u != w:
+            vert[pu], vert[pw] = w, u
+            pos[u], pos[w] = pw, pu
+          start[du] += 1
+          deg[u] -= 1
+
+    return np.array(deg, dtype = np.int64)
+
+  def clustering(self):
+    """
+    Local clustering coefficients of nodes ignoring multiplicities, self-loops and directions.
+    """
+
+    A = self.skeleton()
+    k = np.diff(A.indptr)
+    t = np.asarray((A @ A).multiply(A).sum(1)).ravel()
+
+    C = np.zeros(len(self))
+    C[k > 1] = t[k > 1] / (k[k > 1] * (k[k > 1] - 1))
+
+    return C
+
+  def average_clustering(self):
+    """
+    Average local clustering coefficient of nodes.
+    """
+
+    return self.clustering().mean() if len(self) > 0 else 0.0
+
+  def to_dict(self, values):
+    """
+    Map array of node values to dictionary keyed by node labels.
+    """
+
+    return dict(zip(self.labels, np.asarray(values).tolist()))
+
+  def to_networkx(self, weight = None, cluster = None, multi = False):
+    """
+    Simple NetworkX (di)graph with multiplicities and clusters as optional edge and node attributes, or multigraph with parallel edges.
+    """
+
+    import networkx as nx
+
+    if multi:
+      G = nx.MultiDiGraph(name = self.name) if self.directed else nx.MultiGraph(name = self.name)
+    else:
+      G = nx.DiGraph(name = self.name) if self.directed else nx.Graph(name = self.name)
+    if cluster is None:
+      G.add_nodes_from(self.labels)
+    else:
+      G.add_nodes_from((label, {cluster: c}) for label, c in zip(self.labels, self.clusters.tolist()))
+
+    u, v, w = self.edges()
+    if multi:
+      u, v, w = np.repeat(u, w), np.repeat(v, w), np.ones(w.sum(), dtype = np.int32)
+
+    labels = self.labels
+    if weight is None:
+      G.add_edges_from((labels[i], labels[j]) for i, j in zip(u.tolist(), v.tolist()))
+    else:
+      G.add_edges_from((labels[i], labels[j], {weight: c}) for i, j, c in zip(u.tolist(), v.tolist(), w.tolist()))
+
+    return G
+
+def _row_sums(indptr, weights = None):
+  """
+  Number or total weight of entries in CSR rows.
+  """
+
+  if weights is None:
+    return np.diff(indptr)
+
+  return np.bincount(np.repeat(np.arange(len(indptr) - 1), np.diff(indptr)), weights = weights, minlength = len(indptr) - 1).astype(np.int64)
+
+def from_networkx(G, cluster = None):
+  """
+  Weighted simple (di)graph from (multi)graph G with parallel edges collapsed into multiplicities.
+  """
+
+  labels = list(G)
+  index = {label: i for i, label in enumerate(labels)}
+
+  ends = np.fromiter((index[i] for edge in G.edges() for i in edge[:2]), dtype = np.int64, count = 2 * G.number_of_edges())
+
+  clusters = None
+  if cluster is not None:
+    clusters = [G.nodes[i].get(cluster, 0) for i in labels]
+
+  return Graph(labels, ends[0::2], ends[1::2], G.graph.get('name', ''), clusters, G.is_directed())
+
+def read_pajek(file, path = '../nets'):
+  """
+  Read weighted simple graph with node clusters from Pajek file, or digraph if file has arcs, ignoring vertex coordinates and shapes.
+  """
+
+  with open(os.path.join(path, file + '.net'), 'r') as f:
+    lines = [line for line in f.read().splitlines() if line.strip() and not line.startswith('%')]
+
+  ids, labels, clusters = [], [], []
+  sections = {'*edges': [], '*arcs': []}
+
+  section = None
+  for line in lines:
+    if line.startswith('*'):
+      section = line.split()[0].lower()
+    elif section == '*vertices':
+      node = line.strip().split('"')
+      if len(node) > 2:
+        i, label, rest = node[0], node[1], node[2].split()
+      else:
+        tokens = line.split()
+        i, label, rest = tokens[0], tokens[1] if len(tokens) > 1 else tokens[0], tokens[2:]
+      ids.append(int(i))
+      labels.append(label)
+      clusters.append(int(rest[0]) if len(rest) == 1 and rest[0].lstrip('-').isdigit() else 0)
+    elif section in sections:
+      sections[section].append(line)
+
+  pos = np.full(max(ids, default = 0) + 1, -1, dtype = np.int64)
+  pos[ids] = np.arange(len(ids))
+
+  edges, arcs = pos[_ends(sections['*edges'])], pos[_ends(sections['*arcs'])]
+
+  if len(arcs) == 0:
+    return Graph(labels, edges[:, 0], edges[:, 1], file, clusters)
+
+  back = edges[edges[:, 0] != edges[:, 1]]
+  src = np.concatenate([arcs[:, 0], edges[:, 0], back[:, 1]])
+  dst = np.concatenate([arcs[:, 1], edges[:, 1], back[:, 0]])
+
+  return Graph(labels, src, dst, file, clusters, directed = True)
+
+def _ends(lines):
+  """
+  Endpoint ids of Pajek edge or arc lines ignoring weights.
+  """
+
+  tokens = ' '.join(lines).split()
+  if len(tokens) == 2 * len(lines):
+    return np.array(tokens, dtype = np.int64).reshape(-1, 2)
+
+  return np.array([line.split()[:2] for line in lines], dtype = np.int64).reshape(-1, 2)
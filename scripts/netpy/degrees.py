@@ -0,0 +1,317 @@
+from time import time
+
+import numpy as np
+
+from . import core, parallel
+
+def degree_sequence(G):
+  """
+  Degree sequence of undirected multigraph G as integer array.
+  """
+
+  if isinstance(G, core.Graph):
+    return G.degree(weighted = True)
+
+  return np.fromiter((k for _, k in G.degree()), dtype = np.int64, count = len(G))
+
+def histogram(ks):
+  """
+  Fraction of nodes p_k with degree k = 0, 1, ..., max(ks).
+  """
+
+  ks = np.asarray(ks, dtype = np.int64)
+
+  return np.bincount(ks) / len(ks)
+
+def log_binned(ks, bins = 10):
+  """
+  Degree distribution p_k in logarithmic bins with given number of bins per decade.
+  """
+
+  ks = np.asarray(ks, dtype = np.int64)
+  n = len(ks)
+  ks = ks[ks > 0]
+
+  edges = np.unique(np.ceil(10 ** np.arange(0, np.log10(ks.max()) + 1 / bins, 1 / bins)).astype(np.int64))
+  edges = np.append(edges[edges <= ks.max()], ks.max() + 1)
+
+  counts, _ = np.histogram(ks, edges)
+  pk = counts / (edges[1:] - edges[:-1]) / n
+  centers = np.sqrt(edges[:-1] * (edges[1:] - 1))
+
+  return centers[counts > 0], pk[counts > 0]
+
+def ccdf(ks):
+  """
+  Fraction of nodes P(K >= k) for each distinct degree k.
+  """
+
+  u, c = np.unique(np.asarray(ks, dtype = np.int64), return_counts = True)
+
+  return u, np.cumsum(c[::-1])[::-1] / c.sum()
+
+def _scan(u, c, block = 256):
+  """
+  Power-law exponents and KS distances for all candidate k_min of distinct positive degrees u with counts c.
+  """
+
+  n = np.cumsum(c[::-1])[::-1]
+  L = np.cumsum((c * np.log(u))[::-1])[::-1]
+
+  j = np.arange(len(u) - 1)
+  alpha = 1 + n[j] / (L[j] - n[j] * np.log(u[j] - 0.5))
+
+  D = np.empty(len(j))
+  for b in range(0, len(j), block):
+    jb = j[b:b + block]
+
+    with np.errstate(over = 'ignore'):
+      S = ((u[None, :] - 0.5) / (u[jb, None] - 0.5)) ** (1 - alpha[jb, None])
+    E = n[None, :] / n[jb, None]
+
+    dist = np.abs(E - S)
+    dist[np.arange(len(u))[None, :] < jb[:, None]] = 0
+    D[jb] = dist.max(1)
+
+  return alpha, D
+
+def _tail(ks, kmin):
+  """
+  Distinct degrees at least kmin with their counts.
+  """
+
+  ks = np.asarray(ks, dtype = np.int64)
+
+  return np.unique(ks[ks >= kmin], return_counts = True)
+
+def _logsf(f, k):
+  """
+  Logarithm of P(K >= k) under fitted tail f.
+  """
+
+  k = np.asarray(k, dtype = float)
+
+  if f['dist'] == 'power-law':
+    return (1 - f['alpha']) * np.log((k - 0.5) / (f['kmin'] - 0.5))
+  elif f['dist'] == 'lognormal':
+    from scipy import stats
+
+    z = lambda x: (np.log(x) - f['mu']) / f['sigma']
+    return stats.norm.logsf(z(k - 0.5)) - stats.norm.logsf(z(f['kmin'] - 0.5))
+  elif f['dist'] == 'exponential':
+    return -f['lambda'] * (k - f['kmin'])
+
+  raise ValueError("Unknown distribution '{:s}'".format(f['dist']))
+
+def _logpmf(f, k):
+  """
+  Logarithm of P(K = k) under fitted tail f.
+  """
+
+  a, b = _logsf(f, k), _logsf(f, np.asarray(k) + 1)
+
+  return a + np.log1p(-np.exp(b - a))
+
+def sf(f, k):
+  """
+  Fitted probability P(K >= k) of tail f at degrees k >= kmin.
+  """
+
+  return np.exp(_logsf(f, k))
+
+def fit_powerlaw(ks, kmin = None):
+  """
+  Fit discrete power-law tail by maximum likelihood with k_min minimizing KS distance.
+  """
+
+  ks = np.asarray(ks, dtype = np.int64)
+  u, c = np.unique(ks[ks > 0], return_counts = True)
+
+  if len(u) < 2:
+    raise ValueError("Degree sequence with less than two distinct positive degrees")
+
+  alpha, D = _scan(u, c)
+  if kmin is None:
+    j = np.argmin(D)
+  else:
+    j = np.searchsorted(u, kmin)
+    if j >= len(alpha):
+      raise ValueError("No degrees above kmin = {:d}".format(kmin))
+
+  f = {'dist': 'power-law', 'kmin': int(u[j]), 'alpha': alpha[j], 'D': D[j], 'n': int(c[j:].sum())}
+  f['loglik'] = np.sum(c[j:] * _logpmf(f, u[j:]))
+
+  return f
+
+def fit_tail(ks, dist, kmin):
+  """
+  Fit discrete lognormal or exponential tail above kmin by maximum likelihood, with lognormal also started near its power-law limit.
+  """
+
+  u, c = _tail(ks, kmin)
+  f = {'dist': dist, 'kmin': int(kmin), 'n': int(c.sum())}
+
+  if dist == 'exponential':
+    f['lambda'] = np.log1p(1 / max(np.sum(c * (u - kmin)) / f['n'], 1e-12))
+  elif dist == 'lognormal':
+    from scipy import optimize
+
+    def nll(x):
+      return -np.sum(c * _logpmf({**f, 'mu': x[0], 'sigma': np.exp(x[1])}, u))
+
+    logs = np.repeat(np.log(u), c)
+    alpha = 1 + f['n'] / np.sum(c * np.log(u / (kmin - 0.5)))
+
+    starts = [[logs.mean(), np.log(max(logs.std(), 0.1))], [(1 - alpha) * 50 ** 2, np.log(50)]]
+    x = min((optimize.minimize(nll, x0, method = 'Nelder-Mead') for x0 in starts), key = lambda r: r.fun).x
+    f['mu'], f['sigma'] = x[0], np.exp(x[1])
+    f['collapsed'] = bool(f['mu'] < np.log(kmin / 10))
+  else:
+    raise ValueError("Unknown distribution '{:s}'".format(dist))
+
+  f['loglik'] = np.sum(c * _logpmf(f, u))
+  f['D'] = np.max(np.abs(np.cumsum(c[::-1])[::-1] / f['n'] - sf(f, u)))
+
+  return f
+
+def fit(ks, kmin = None):
+  """
+  Fit power-law, lognormal and exponential tails of degree sequence above common k_min.
+  """
+
+  pl = fit_powerlaw(ks, kmin)
+
+  return {'power-law': pl, 'lognormal': fit_tail(ks, 'lognormal', pl['kmin']), 'exponential': fit_tail(ks, 'exponential', pl['kmin'])}
+
+def compare(ks, f, g):
+  """
+  Normalized log-likelihood ratio of fitted tails f and g with its two-sided p-value.
+  """
+
+  from scipy import special
+
+  u, c = _tail(ks, f['kmin'])
+  l = np.repeat(_logpmf(f, u) - _logpmf(g, u), c)
+
+  R = l.sum()
+  s = l.std()
+  if s == 0:
+    return R, 1.0
+
+  return R / np.sqrt(len(l)) / s, special.erfc(abs(R) / np.sqrt(2 * len(l)) / s)
+
+def _bootstrap(body, n, kmin, alpha, k, seed, batch = 10 ** 7):
+  """
+  KS distances of power-law fits to k semi-parametric bootstrap samples.
+  """
+
+  rng = np.random.default_rng(seed)
+  q = 1 - len(body) / n
+
+  D = np.empty(k)
+  size = max(1, min(k, batch // n))
+  for b in range(0, k, size):
+    s = min(size, k - b)
+
+    r = rng.random((s, n))
+    tail = np.floor(np.minimum((kmin - 0.5) * (1 - r) ** (-1 / (alpha - 1)) + 0.5, 1e15)).astype(np.int64)
+    if len(body) > 0:
+      tail = np.where(rng.random((s, n)) < q, tail, body[rng.integers(len(body), size = (s, n))])
+
+    for i in range(s):
+      u, c = np.unique(tail[i][tail[i] > 0], return_counts = True)
+      D[b + i] = _scan(u, c)[1].min() if len(u) > 1 else 0
+
+  return D
+
+def gof(ks, f, k = 500, workers = None, seed = None):
+  """
+  Bootstrap p-value of KS goodness-of-fit of power-law tail f with k synthetic degree sequences.
+  """
+
+  ks = np.asarray(ks, dtype = np.int64)
+  body = ks[ks < f['kmin']]
+
+  parts = parallel.chunks(k, 4 * parallel.workers(workers))
+  seeds = np.random.SeedSequence(seed).spawn(len(parts))
+  args = [(body, len(ks), f['kmin'], f['alpha'], p.stop - p.start, s) for p, s in zip(parts, seeds)]
+
+  if parallel.workers(workers) == 1:
+    D = [_bootstrap(*arg) for arg in args]
+  else:
+    with parallel.pool(workers) as pool:
+      D = list(pool.map(_bootstrap, *zip(*args)))
+
+  return np.mean(np.concatenate(D) >= f['D'])
+
+def fit_info(name, ks, k = 100, workers = None):
+  """
+  Print maximum likelihood fits of degree distribution tail with goodness-of-fit.
+  """
+
+  tic = time()
+
+  print("{:>15s} | '{:s}'".format('Graph', name))
+
+  fits = fit(ks)
+  pl = fits['power-law']
+
+  print("{:>15s} | {:.3f} ({:,d}, {:.1f}%)".format('Power-law', pl['alpha'], pl['kmin'], 100 * pl['n'] / len(ks)))
+  if k > 0:
+    print("{:>15s} | {:.4f} (p = {:.2f}, {:d}x)".format('KS', pl['D'], gof(ks, pl, k, workers), k))
+
+  R, p = compare(ks, pl, fits['lognormal'])
+  if fits['lognormal']['collapsed']:
+    print("{:>15s} | {:s} (R = {:.2f}, p = {:.2f})".format('Lognormal', 'power-law limit', R, p))
+  else:
+    print("{:>15s} | {:.3f}, {:.3f} (R = {:.2f}, p = {:.2f})".format('Lognormal', fits['lognormal']['mu'], fits['lognormal']['sigma'], R, p))
+
+  R, p = compare(ks, pl, fits['exponential'])
+  print("{:>15s} | {:.3f} (R = {:.2f}, p = {:.2f})".format('Exponential', fits['exponential']['lambda'], R, p))
+
+  print("{:>15s} | {:.1f} sec\n".format('Time', time() - tic))
+
+  return fits
+
+def plot_pk(ks, ax = None):
+  """
+  Plot degree distribution with raw and logarithmically binned fractions of nodes.
+  """
+
+  import matplotlib.pyplot as plt
+
+  ax = ax or plt.gca()
+
+  pk = histogram(ks)
+  k = np.flatnonzero(pk[1:]) + 1
+
+  ax.loglog(k, pk[k], '*', color = 'lightgray', label = 'raw')
+  ax.loglog(*log_binned(ks), 'ok', label = 'log-binned')
+  ax.set_ylabel('Fraction of nodes $p_k$')
+  ax.set_xlabel('Node degree $k$')
+  ax.legend()
+
+  return ax
+
+def plot_ccdf(ks, fits = None, ax = None):
+  """
+  Plot complementary cumulative degree distribution with fitted tails.
+  """
+
+  import matplotlib.pyplot as plt
+
+  ax = ax or plt.gca()
+
+  u, S = ccdf(ks)
+  ax.loglog(u[u > 0], S[u > 0], '.k', label = 'data')
+
+  for label, f in (fits or {}).items():
+    k = np.unique(np.geomspace(f['kmin'], u.max(), 100).astype(np.int64))
+    ax.loglog(k, f['n'] / len(ks) * sf(f, k), '-', label = label)
+
+  ax.set_ylim(bottom = S[u > 0].min() / 2)
+  ax.set_ylabel('Fraction of nodes $P_k$')
+  ax.set_xlabel('Node degree $k$')
+  ax.legend()
+
+  return ax
@@ -0,0 +1,202 @@
+import io
+import os
+from time import time
+
+import numpy as np
+
+from . import core
+
+def node2vec(G, dimensions = 32, p = 1, q = 1, workers = 8):
+  """
+  Node2vec embeddings of nodes of core graph or NetworkX graph G as float32 array in node order.
+  """
+
+  from node2vec import Node2Vec
+
+  G = G.to_networkx() if isinstance(G, core.Graph) else G
+  wv = Node2Vec(G, dimensions = dimensions, p = p, q = q, workers = workers, quiet = True).fit().wv
+
+  return np.array([wv[str(i)] for i in G.nodes()], dtype = np.float32)
+
+def save(file, X, labels, path = '../nets'):
+  """
+  Save node embeddings X as float32 NumPy array with index of node labels in separate text file.
+  """
+
+  base = os.path.join(path, file)
+
+  np.save(base + '.npy', np.ascontiguousarray(X, dtype = np.float32))
+  with open(base + '.labels', 'w') as f:
+    f.write(''.join(str(i) + '\n' for i in labels))
+
+def load(file, path = '../nets', mmap = True):
+  """
+  Load node embeddings as memory-mapped float32 array and list of node labels.
+  """
+
+  base = os.path.join(path, file)
+
+  X = np.load(base + '.npy', mmap_mode = 'r' if mmap else None)
+  with open(base + '.labels', 'r') as f:
+    labels = f.read().splitlines()
+
+  return X, labels
+
+def write_tab(file, X, labels, classes, prefix = 'node2vec'):
+  """
+  Write node embeddings X with node labels and classes to tab-separated file for Orange.
+  """
+
+  buffer = io.StringIO()
+  np.savetxt(buffer, X, fmt = '%.9g', delimiter = '\t')
+
+  with open(file, 'w') as f:
+    f.write("m#node\t" + "\t".join(["C#" + prefix + "-" + str(i) for i in range(X.shape[1])]) + "\tcD#class\n")
+    f.writelines("{}\t{:s}\t{}\n".format(i, row, c) for i, row, c in zip(labels, buffer.getvalue().splitlines(), classes))
+
+def _normalize(X):
+  """
+  Rows of X scaled to unit length as float32 array.
+  """
+
+  X = np.asarray(X, dtype = np.float32)
+
+  return X / np.maximum(np.linalg.norm(X, axis = 1, keepdims = True), 1e-12)
+
+def _merge(S, I, k):
+  """
+  At most k highest similarities per row with their indices in decreasing order.
+  """
+
+  if S.shape[1] > k:
+    part = np.argpartition(-S, k - 1, axis = 1)[:, :k]
+    S, I = np.take_along_axis(S, part, 1), np.take_along_axis(I, part, 1)
+
+  order = np.argsort(-S, axis = 1, kind = 'stable')
+
+  return np.take_along_axis(S, order, 1), np.take_along_axis(I, order, 1)
+
+class Index:
+  """
+  Cosine nearest-neighbour index of node embeddings, exact by blocked matrix products or approximate by inverted file of k-means cells.
+  """
+
+  def __init__(self, X, labels = None, name = '', block = 4096):
+    self.X = _normalize(X)
+    self.labels = list(labels) if labels is not None else list(range(len(self.X)))
+    self.index = {label: i for i, label in enumerate(self.labels)}
+    self.name = name
+    self.block = block
+    self.cells = None
+
+  def __len__(self):
+    return len(self.X)
+
+  def _assign(self, X, C):
+    """
+    Indices of most similar centroids C of rows of X over row blocks.
+    """
+
+    return np.concatenate([np.argmax(X[b:b + self.block] @ C.T, axis = 1) for b in range(0, len(X), self.block)])
+
+  def train(self, cells = None, iters = 10, sample = 256, seed = None):
+    """
+    Build inverted file of spherical k-means cells with nodes sorted by cell in CSR layout.
+    """
+
+    from scipy.sparse import csr_matrix
+
+    rng = np.random.default_rng(seed)
+
+    n = len(self.X)
+    c = min(cells if cells is not None else max(1, int(np.sqrt(n))), n)
+
+    S = self.X[np.sort(rng.choice(n, min(n, sample * c), replace = False))]
+    C = S[rng.choice(len(S), c, replace = False)]
+
+    for _ in range(iters):
+      a = self._assign(S, C)
+      sums = csr_matrix((np.ones(len(S), dtype = np.float32), (a, np.arange(len(S)))), shape = (c, len(S))) @ S
+      empty = np.bincount(a, minlength = c) == 0
+      C = np.where(empty[:, None], C, _normalize(sums))
+
+    a = self._assign(self.X, C)
+    order = np.argsort(a, kind = 'stable')
+    indptr = np.concatenate([[0], np.cumsum(np.bincount(a, minlength = c))])
+
+    self.cells = (C, indptr, order)
+
+    return self
+
+  def _exact(self, Q, k):
+    """
+    Top k neighbours of normalized queries Q by blocked products with all embeddings.
+    """
+
+    S = np.empty((len(Q), 0), dtype = np.float32)
+    I = np.empty((len(Q), 0), dtype = np.int64)
+    for b in range(0, len(self.X), self.block):
+      B = Q @ self.X[b:b + self.block].T
+      J = np.broadcast_to(np.arange(b, b + B.shape[1]), B.shape)
+      S, I = _merge(np.hstack([S, B]), np.hstack([I, J]), k)
+
+    return S, I
+
+  def _approx(self, Q, k, probes):
+    """
+    Top k neighbours of normalized queries Q among embeddings in most similar probed cells.
+    """
+
+    C, indptr, order = self.cells
+    probes = min(probes, len(C))
+
+    S = np.full((len(Q), k), -np.inf, dtype = np.float32)
+    I = np.full((len(Q), k), -1, dtype = np.int64)
+    for q, cells in enumerate(np.argpartition(-(Q @ C.T), probes - 1, axis = 1)[:, :probes]):
+      J = np.concatenate([order[indptr[c]:indptr[c + 1]] for c in cells])
+      s, j = _merge((self.X[J] @ Q[q])[None, :], J[None, :], k)
+      S[q, :s.shape[1]], I[q, :s.shape[1]] = s[0], j[0]
+
+    return S, I
+
+  def query(self, Q, k = 10, approx = False, probes = 8):
+    """
+    Cosine similarities and indices of k nearest embeddings of each query row, padded with -inf and -1 if approximate search finds fewer.
+    """
+
+    Q = _normalize(np.atleast_2d(Q))
+    k = min(k, len(self.X))
+
+    if not approx:
+      return self._exact(Q, k)
+
+    if self.cells is None:
+      self.train()
+
+    return self._approx(Q, k, probes)
+
+  def similar(self, label, k = 10, approx = False, probes = 8):
+    """
+    List of k most similar nodes to node with label and their cosine similarities.
+    """
+
+    i = self.index[label]
+    S, I = self.query(self.X[i], k + 1, approx, probes)
+
+    return [(self.labels[j], s) for s, j in zip(S[0].tolist(), I[0].tolist()) if j >= 0 and j != i][:k]
+
+def similar_info(index, label, k = 10, approx = False):
+  """
+  Print most similar nodes to node with label in nearest-neighbour index.
+  """
+
+  tic = time()
+  similar = index.similar(label, k, approx)
+  toc = time() - tic
+
+  print("{:>15s} | '{:s}'".format('Graph', index.name))
+  print("{:>15s} | '{:s}' ({:s})".format('Similar', str(label), 'approx' if approx else 'exact'))
+
+  for j, s in similar:
+    print("{:>15.8f} | '{:s}'".format(s, str(j)))
+  print("{:>15s} | {:.1f} ms\n".format('Query', 1000 * toc))
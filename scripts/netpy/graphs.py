@@ -0,0 +1,64 @@
+from time import time
+
+import numpy as np
+from scipy.sparse import csgraph
+
+from . import core
+
+def approx_dists(A, n = 100):
+  """
+  Approximate average distance and diameter of undirected graph with sparse adjacency matrix A.
+  """
+
+  nodes = np.arange(A.shape[0]) if A.shape[0] <= n else np.random.default_rng().choice(A.shape[0], n, replace = False)
+
+  ds = []
+  for b in range(0, len(nodes), 10):
+    D = csgraph.shortest_path(A, unweighted = True, indices = nodes[b:b + 10])
+    ds.append(D[np.isfinite(D) & (D > 0)])
+  ds = np.concatenate(ds)
+
+  return (ds.mean(), int(ds.max())) if len(ds) > 0 else (0.0, 0)
+
+def graph_info(G, full = False, cons_time = None, fast = False):
+  """
+  Print basic statistics of core graph or (un)directed multigraph G.
+  """
+
+  tic = time()
+
+  H = G if isinstance(G, core.Graph) else core.from_networkx(G)
+  line = '=' if (H.weights > 1).any() else '-'
+
+  print("{:>15s} | '{:s}'".format('Graph', H.name))
+  print("{:>15s} | '{:s}'".format('Type', line * 2 + ('>' if H.directed else line)))
+
+  n = len(H)
+  m = H.number_of_edges(weighted = True)
+  ks = H.degree(weighted = True)
+
+  print("{:>15s} | {:,d} ({:,d})".format('Nodes', n, np.count_nonzero(ks == 0)))
+  print("{:>15s} | {:,d} ({:,d})".format('Edges', m, H.number_of_selfloops(weighted = True)))
+  print("{:>15s} | {:.1f} ({:,d}, {:,d})".format('Degree', 2 * m / n, ks.min(), ks.max()))
+
+  if full:
+    print("{:>15s} | {:.8f}".format('Density', (1 if H.directed else 2) * m / n / (n - 1)))
+
+  if not fast:
+    A = H.skeleton()
+    c, CCs = csgraph.connected_components(A, directed = False)
+    sizes = np.bincount(CCs)
+
+    print("{:>15s} | {:.1f}% ({:,d})".format('Components', 100 * sizes.max() / n, c) + ('' if full else '\n'))
+
+    if full:
+      largest = CCs == sizes.argmax()
+      d, D = approx_dists(A[largest][:, largest])
+
+      print("{:>15s} | {:.3f} ({:,d})".format('Distances', d, D))
+      print("{:>15s} | {:.6f}".format('Clustering', H.average_clustering()))
+
+  if full:
+    if cons_time is not None:
+      print("{:>15s} | {:.1f} sec".format('Construction', cons_time))
+    print("{:>15s} | {:.1f} sec\n".format('Analysis', time() - tic))
@@ -0,0 +1,200 @@
+from time import time
+
+import numpy as np
+from scipy import sparse
+
+from . import core
+
+METHODS = ['common-neighbours', 'jaccard', 'adamic-adar', 'resource-allocation', 'preferential-attachment']
+LABELS = {'common-neighbours': 'Common', 'jaccard': 'Jaccard', 'adamic-adar': 'Adamic-Adar', 'resource-allocation': 'Resource', 'preferential-attachment': 'Preferential'}
+
+def _weights(k, method):
+  """
+  Contribution of common neighbours with degrees k to score of method.
+  """
+
+  if method == 'adamic-adar':
+    return np.divide(1, np.log(np.maximum(k, 2)), out = np.zeros(len(k)), where = k > 1)
+  elif method == 'resource-allocation':
+    return np.divide(1, k, out = np.zeros(len(k)), where = k > 0)
+  elif method in ['common-neighbours', 'jaccard']:
+    return np.ones(len(k))
+
+  raise ValueError("Unknown method '{:s}'".format(method))
+
+def scores(G, u, v, method = 'adamic-adar', block = 2 ** 16):
+  """
+  Link prediction scores of node pairs (u, v) of core graph G computed in blocks of pairs.
+  """
+
+  A = G.skeleton()
+  k = np.diff(A.indptr)
+  u, v = np.asarray(u), np.asarray(v)
+
+  if method == 'preferential-attachment':
+    return (k[u] * k[v]).astype(float)
+
+  w = _weights(k, method)
+
+  s = np.empty(len(u))
+  for b in range(0, len(u), block):
+    s[b:b + block] = A[u[b:b + block]].multiply(A[v[b:b + block]]) @ w
+
+  if method == 'jaccard':
+    s = np.divide(s, k[u] + k[v] - s, out = np.zeros(len(s)), where = k[u] + k[v] - s > 0)
+
+  return s
+
+def _top(rows, cols, data, k):
+  """
+  At most k highest scoring entries per row of sparse scores.
+  """
+
+  order = np.lexsort((cols, -data, rows))
+  rows, cols, data = rows[order], cols[order], data[order]
+
+  first = np.searchsorted(rows, rows, side = 'left')
+  keep = np.arange(len(rows)) - first < k
+
+  return rows[keep], cols[keep], data[keep]
+
+def top_k(G, method = 'adamic-adar', k = 10, block = 1024):
+  """
+  Top k candidate links of each node of core graph G from sparse score products over row blocks.
+  """
+
+  A = G.skeleton()
+  deg = np.diff(A.indptr)
+  n = len(G)
+
+  src, dst, score = [], [], []
+  for b in range(0, n, block):
+    rows = np.arange(b, min(b + block, n))
+    B = A[rows]
+
+    if method == 'preferential-attachment':
+      cand = np.argsort(-deg, kind = 'stable')[:k + deg[rows].max() + 1]
+      S = np.outer(deg[rows], deg[cand]).astype(float)
+      S[B[:, cand].toarray() > 0] = -1
+      S[rows[:, None] == cand[None, :]] = -1
+
+      i, j = np.nonzero(S >= 0)
+      i, j, s = _top(i, cand[j], S[i, j], k)
+    else:
+      S = (B @ sparse.diags(_weights(deg, method)) @ A).tocsr()
+      S = (S - S.multiply(B)).tocoo()
+      i, j, s = S.row, S.col, S.data
+
+      keep = (rows[i] != j) & (s > 0)
+      i, j, s = i[keep], j[keep], s[keep]
+
+      if method == 'jaccard':
+        s = s / (deg[rows[i]] + deg[j] - s)
+
+      i, j, s = _top(i, j, s, k)
+
+    src.append(rows[i])
+    dst.append(j)
+    score.append(s)
+
+  return np.concatenate(src), np.concatenate(dst), np.concatenate(score)
+
+def holdout(G, fraction = 0.1, seed = None):
+  """
+  Split core graph G into undirected training graph and held-out distinct edges, with arcs of directed G merged into edges.
+  """
+
+  rng = np.random.default_rng(seed)
+
+  if G.directed:
+    A = sparse.triu(G.skeleton(), 1).tocoo()
+    u, v, w = A.row, A.col, np.ones(len(A.row), dtype = np.int64)
+  else:
+    u, v, w = G.edges()
+  keep = u != v
+  u, v, w = u[keep], v[keep], w[keep]
+
+  test = rng.random(len(u)) < fraction
+  train = core.Graph(G.labels, np.repeat(u[~test], w[~test]), np.repeat(v[~test], w[~test]), G.name, G.clusters)
+
+  return train, u[test], v[test]
+
+def negatives(G, size, seed = None):
+  """
+  Uniformly sampled distinct node pairs of core graph G that are not linked.
+  """
+
+  rng = np.random.default_rng(seed)
+
+  n = len(G)
+  A = G.skeleton()
+  keys = np.sort(np.repeat(np.arange(n, dtype = np.int64), np.diff(A.indptr)) * n + A.indices)
+
+  pairs = np.empty(0, dtype = np.int64)
+  while len(pairs) < size:
+    u, v = rng.integers(n, size = (2, 2 * (size - len(pairs)) + 16))
+    u, v = np.minimum(u, v), np.maximum(u, v)
+
+    key = u * n + v
+    pos = np.minimum(np.searchsorted(keys, key), max(len(keys) - 1, 0))
+    linked = keys[pos] == key if len(keys) > 0 else np.zeros(len(key), dtype = bool)
+
+    pairs = np.unique(np.concatenate([pairs, key[(u != v) & ~linked]]))
+    if len(pairs) + len(keys) // 2 >= n * (n - 1) // 2:
+      break
+
+  pairs = rng.permutation(pairs)[:size]
+
+  return pairs // n, pairs % n
+
+def auc(positive, negative):
+  """
+  Probability that positive pair scores higher than negative pair with ties counted half.
+  """
+
+  from scipy import stats
+
+  ranks = stats.rankdata(np.concatenate([positive, negative]))
+
+  return (ranks[:len(positive)].sum() - len(positive) * (len(positive) + 1) / 2) / len(positive) / len(negative)
+
+def precision(positive, negative, k = None):
+  """
+  Fraction of positive pairs among k highest scoring pairs.
+  """
+
+  k = k or len(positive)
+  s = np.concatenate([positive, negative])
+  labels = np.concatenate([np.ones(len(positive)), np.zeros(len(negative))])
+
+  return labels[np.lexsort((labels, -s))[:k]].mean()
+
+def evaluate(G, methods = METHODS, fraction = 0.1, seed = None, k = None):
+  """
+  AUC and precision at k, by default number of held-out edges, of link prediction methods on held-out edges of core graph G.
+  """
+
+  train, u, v = holdout(G, fraction, seed)
+  x, y = negatives(G, len(u), seed)
+
+  results = {}
+  for method in methods:
+    positive, negative = scores(train, u, v, method), scores(train, x, y, method)
+    results[method] = auc(positive, negative), precision(positive, negative, k)
+
+  return results
+
+def links_info(G, methods = METHODS, fraction = 0.1, seed = None, k = None):
+  """
+  Print AUC and precision at k of link prediction methods on held-out edges of core graph G.
+  """
+
+  tic = time()
+
+  print("{:>15s} | '{:s}'".format('Graph', G.name))
+  print("{:>15s} | {:.0f}% ({:,d})".format('Holdout', 100 * fraction, G.number_of_edges()))
+
+  for method, (a, p) in evaluate(G, methods, fraction, seed, k).items():
+    print("{:>15s} | {:.3f} ({:.3f})".format(LABELS[method], a, p))
+
+  print("{:>15s} | {:.1f} sec\n".format('Time', time() - tic))
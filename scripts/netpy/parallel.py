@@ -0,0 +1,33 @@
+import os
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor
+
+def workers(k = None):
+  """
+  Number of worker processes, all cores by default.
+  """
+
+  return max(1, k if k is not None else os.cpu_count() or 1)
+
+def context():
+  """
+  Multiprocessing context that also runs from scripts without main guard.
+  """
+
+  return mp.get_context('fork' if 'fork' in mp.get_all_start_methods() else None)
+
+def pool(k = None):
+  """
+  Process pool of k workers that also runs from scripts without main guard.
+  """
+
+  return ProcessPoolExecutor(workers(k), mp_context = context())
+
+def chunks(n, k):
+  """
+  Split range(n) into at most k contiguous non-empty slices.
+  """
+
+  bounds = [n * c // k for c in range(k + 1)]
+
+  return [slice(a, b) for a, b in zip(bounds[:-1], bounds[1:]) if b > a]
@@ -0,0 +1,124 @@
+import numpy as np
+
+from . import centrality, parallel
+from .cache import cached
+
+STRATEGIES = ['random', 'degree', 'betweenness', 'core']
+
+def percolation(G, order):
+  """
+  Fraction of nodes in largest component of core graph G after removing first i nodes of order for i = 0, ..., n.
+  """
+
+  n = len(G)
+
+  A = G.skeleton()
+  indptr, indices = A.indptr.tolist(), A.indices.tolist()
+
+  parent = list(range(n))
+  size = [1] * n
+  present = [False] * n
+
+  S = [0] * (n + 1)
+  largest = 0
+  for t, i in enumerate(reversed(np.asarray(order).tolist())):
+    present[i] = True
+
+    for j in indices[indptr[i]:indptr[i + 1]]:
+      if not present[j]:
+        continue
+
+      while parent[i] != i:
+        parent[i] = parent[parent[i]]
+        i = parent[i]
+      while parent[j] != j:
+        parent[j] = parent[parent[j]]
+        j = parent[j]
+
+      if i != j:
+        if size[i] < size[j]:
+          i, j = j, i
+        parent[j] = i
+        size[i] += size[j]
+        largest = max(largest, size[i])
+
+    S[n - 1 - t] = max(largest, 1)
+
+  return np.array(S) / max(n, 1)
+
+def attack_order(G, strategy = 'degree', k = None, seed = None):
+  """
+  Order of node removal from core graph G by random failures or targeted attack, with betweenness cached unless sampled from k pivots without seed.
+  """
+
+  rng = np.random.default_rng(seed)
+
+  if strategy == 'random':
+    return rng.permutation(len(G))
+  elif strategy == 'degree':
+    values = G.degree()
+  elif strategy == 'betweenness':
+    k = k if k is None or k < len(G) else None
+    if k is not None and seed is None:
+      values = centrality.betweenness(G, k = k)
+    else:
+      values = cached(G, 'betweenness', centrality.betweenness, k = k, seed = None if k is None else seed)
+  elif strategy == 'core':
+    values = G.core_number() * (G.degree().max() + 1) + G.degree()
+  else:
+    raise ValueError("Unknown strategy '{:s}'".format(strategy))
+
+  return np.lexsort((rng.random(len(G)), -values))
+
+def _failures(G, seeds):
+  """
+  Sum of percolation curves of random failures with given seeds.
+  """
+
+  return sum(percolation(G, np.random.default_rng(seed).permutation(len(G))) for seed in seeds)
+
+def failures(G, k = 100, workers = None, seed = None):
+  """
+  Percolation curve of core graph G under random failures averaged over k seeds in parallel.
+  """
+
+  seeds = np.random.SeedSequence(seed).spawn(k)
+  parts = [seeds[p] for p in parallel.chunks(k, parallel.workers(workers))]
+
+  if len(parts) == 1:
+    return _failures(G, seeds) / k
+
+  with parallel.pool(workers) as pool:
+    return sum(pool.map(_failures, [G] * len(parts), parts)) / k
+
+def tolerance(G, strategies = STRATEGIES, k = 100, pivots = None, workers = None, seed = None):
+  """
+  Percolation curves of core graph G for random failures and targeted attacks.
+  """
+
+  curves = {}
+  for strategy in strategies:
+    if strategy == 'random':
+      curves[strategy] = failures(G, k, workers, seed)
+    else:
+      curves[strategy] = percolation(G, attack_order(G, strategy, pivots, seed))
+
+  return curves
+
+def plot_tolerance(curves, ax = None):
+  """
+  Plot fraction of nodes in largest component against fraction of removed nodes.
+  """
+
+  import matplotlib.pyplot as plt
+
+  ax = ax or plt.gca()
+
+  for label, S in curves.items():
+    ax.plot(np.arange(len(S)) / (len(S) - 1), S, '-', label = label)
+
+  ax.set_ylabel('Largest component $S$')
+  ax.set_xlabel('Removed nodes $f$')
+  ax.legend()
+
+  return ax
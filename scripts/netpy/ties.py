@@ -0,0 +1,162 @@
+from time import time
+
+import numpy as np
+
+from . import centrality, links, parallel
+from .cache import cached
+
+def edges(G):
+  """
+  Endpoints u < v of distinct edges of core graph G ignoring multiplicities, self-loops and directions.
+  """
+
+  A = G.skeleton()
+  u = np.repeat(np.arange(len(G)), np.diff(A.indptr))
+  upper = u < A.indices
+
+  return u[upper], A.indices[upper].astype(np.int64)
+
+def _common(G, u, v):
+  """
+  Numbers of common neighbours of endpoints of edges (u, v) from sparse row products.
+  """
+
+  return np.rint(links.scores(G, u, v, 'common-neighbours')).astype(np.int64)
+
+def embeddedness(G, u, v, workers = None, block = 2 ** 16):
+  """
+  Numbers of common neighbours of endpoints of edges (u, v) of core graph G computed in parallel over edge chunks of at least block edges.
+  """
+
+  parts = parallel.chunks(len(u), min(parallel.workers(workers), max(len(u) // block, 1)))
+
+  if len(parts) <= 1:
+    return _common(G, u, v)
+
+  with parallel.pool(workers) as pool:
+    return np.concatenate(list(pool.map(_common, [G] * len(parts), [u[p] for p in parts], [v[p] for p in parts])))
+
+def bridges(G):
+  """
+  Mask of bridges among edges of core graph G from iterative Tarjan lowlinks in linear time.
+  """
+
+  A = G.skeleton()
+  indptr, indices = A.indptr.tolist(), A.indices.tolist()
+
+  n = len(G)
+  disc, low, parent = [-1] * n, [0] * n, [-1] * n
+
+  t = 0
+  for s in range(n):
+    if disc[s] >= 0:
+      continue
+
+    disc[s] = low[s] = t
+    t += 1
+
+    stack = [(s, indptr[s])]
+    while stack:
+      i, e = stack[-1]
+      if e < indptr[i + 1]:
+        stack[-1] = (i, e + 1)
+        j = indices[e]
+        if disc[j] < 0:
+          disc[j] = low[j] = t
+          t += 1
+          parent[j] = i
+          stack.append((j, indptr[j]))
+        elif j != parent[i]:
+          low[i] = min(low[i], disc[j])
+      else:
+        stack.pop()
+        if parent[i] >= 0:
+          low[parent[i]] = min(low[parent[i]], low[i])
+
+  disc, low, parent = np.array(disc), np.array(low), np.array(parent)
+
+  child = np.flatnonzero(parent >= 0)
+  child = child[low[child] > disc[parent[child]]]
+  keys = np.minimum(child, parent[child]) * n + np.maximum(child, parent[child])
+
+  u, v = edges(G)
+
+  return np.isin(u * n + v, keys)
+
+def tie_strength(G, workers = None):
+  """
+  Endpoints of distinct edges of core graph G with their embeddedness, neighbourhood overlap, edge clustering coefficient and (local) bridge masks.
+  """
+
+  u, v = edges(G)
+  k = np.diff(G.skeleton().indptr)
+
+  c = embeddedness(G, u, v, workers)
+
+  union = k[u] + k[v] - 2 - c
+  overlap = np.divide(c, union, out = np.zeros(len(c)), where = union > 0)
+
+  kmin = np.minimum(k[u], k[v]) - 1
+  clustering = np.divide(c + 1, kmin, out = np.full(len(c), np.nan), where = kmin > 0)
+
+  return u, v, {'embeddedness': c, 'overlap': overlap, 'clustering': clustering, 'bridge': bridges(G), 'local-bridge': c == 0}
+
+def bridging_coefficient(G):
+  """
+  Bridging coefficients of nodes of core graph G as inverse degree relative to sum of inverse degrees of neighbours.
+  """
+
+  A = G.skeleton()
+  k = np.diff(A.indptr)
+
+  inv = np.divide(1, k, out = np.zeros(len(k)), where = k > 0)
+  total = A @ inv
+
+  return np.divide(inv, total, out = np.zeros(len(k)), where = total > 0)
+
+def bridging_centrality(G):
+  """
+  Bridging centrality of nodes of core graph G as product of cached betweenness and bridging coefficient.
+  """
+
+  return cached(G, 'betweenness', centrality.betweenness) * bridging_coefficient(G)
+
+def top_edges(G, u, v, values, label, n = 15, reverse = False):
+  """
+  Print highest, or lowest if reverse, valued edges (u, v) of core graph G with endpoint degrees.
+  """
+
+  print("{:>15s} | '{:s}'".format('Graph', G.name))
+  print("{:>15s} | '{:s}'".format('Tie', label))
+
+  values = np.asarray(values, dtype = float)
+  k = np.diff(G.skeleton().indptr)
+  defined = np.flatnonzero(~np.isnan(values))
+
+  order = np.lexsort((-np.maximum(k[u], k[v])[defined], -np.minimum(k[u], k[v])[defined], values[defined] if reverse else -values[defined]))
+  for e in defined[order][:n]:
+    i, j = G.labels[u[e]], G.labels[v[e]]
+    print("{:>15.8f} | '{:s}' -- '{:s}' ({:,d}, {:,d})".format(values[e], str(i), str(j), k[u[e]], k[v[e]]))
+  print()
+
+def ties_info(G, workers = None):
+  """
+  Print edge tie strength and bridging statistics of core graph G.
+  """
+
+  tic = time()
+
+  u, v, measures = tie_strength(G, workers)
+
+  m = max(len(u), 1)
+
+  print("{:>15s} | '{:s}'".format('Graph', G.name))
+  print("{:>15s} | {:,d}".format('Ties', len(u)))
+  print("{:>15s} | {:.3f} ({:.1f})".format('Overlap', measures['overlap'].sum() / m, measures['embeddedness'].sum() / m))
+  print("{:>15s} | {:,d} ({:.1f}%)".format('Bridges', np.count_nonzero(measures['bridge']), 100 * np.count_nonzero(measures['bridge']) / m))
+  print("{:>15s} | {:,d} ({:.1f}%)".format('Local bridges', np.count_nonzero(measures['local-bridge']), 100 * np.count_nonzero(measures['local-bridge']) / m))
+  print("{:>15s} | {:.1f} sec\n".format('Time', time() - tic))
+
+  top_edges(G, u, v, measures['overlap'], 'overlap', reverse = True)
+  top_edges(G, u, v, measures['embeddedness'], 'embeddedness')
+  centrality.top_nodes(G, bridging_centrality(G), 'bridging')